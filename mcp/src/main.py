@@ -3,19 +3,43 @@ Simple ChatGPT App Template - MCP Server
 A minimal template for building ChatGPT apps with FastMCP.
 """
 
+import os
+from importlib import import_module
+
 from fastmcp import FastMCP
-from tools.math_tools import register_math_tools
-from tools.ux_widget import register_ux_widget_tools
+
+# Tool modules and their register functions, keyed by the name used in
+# MCP_ENABLED_TOOLS. Modules are only imported when enabled.
+TOOL_MODULES = {
+    "math": ("tools.math_tools", "register_math_tools"),
+    "ux_widget": ("tools.ux_widget", "register_ux_widget_tools"),
+}
+
+def register_tools(mcp: FastMCP):
+    """Import and register the enabled tool modules with FastMCP."""
+    enabled = os.getenv("MCP_ENABLED_TOOLS", ",".join(TOOL_MODULES))
+    names = list(dict.fromkeys(name.strip() for name in enabled.split(",") if name.strip()))
+
+    # Validate the whole list before registering anything
+    if not names:
+        raise ValueError("MCP_ENABLED_TOOLS is set but lists no tool modules")
+    unknown = [name for name in names if name not in TOOL_MODULES]
+    if unknown:
+        raise ValueError(f"Unknown tool modules in MCP_ENABLED_TOOLS: {', '.join(unknown)}")
+
+    for name in names:
+        module_name, register_name = TOOL_MODULES[name]
+        register = getattr(import_module(module_name), register_name)
+        register(mcp)
 
 # Create FastMCP instance
 mcp = FastMCP()
 
 # Register tools
-register_math_tools(mcp)
-register_ux_widget_tools(mcp)
+register_tools(mcp)
 
 if __name__ == "__main__":
     mcp.run(
         transport="http",
         port=8123
-    )
\ No newline at end of file
+    )
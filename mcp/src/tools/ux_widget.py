@@ -5,20 +5,8 @@ Implements proper OpenAI Apps SDK widget pattern with resource registration.
 
 from fastmcp import FastMCP
 
-def register_ux_widget_tools(mcp: FastMCP):
-    """Register hello world widget tools with FastMCP."""
-    
-    # Register the widget resource
-    @mcp.resource(
-        uri="ui://widget/hello-world.html",
-        name="hello-world-widget",
-        title="Hello World Widget",
-        description="A simple hello world widget demonstrating ChatGPT custom UI",
-        mime_type="text/html+skybridge"
-    )
-    def hello_world_widget_resource():
-        """Return the HTML content for the hello world widget."""
-        return """
+# Widget HTML, built once at import and served as-is on every resource read
+HELLO_WORLD_WIDGET_HTML = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -134,7 +122,22 @@ def register_ux_widget_tools(mcp: FastMCP):
     </script>
 </body>
 </html>
-        """.strip()
+""".strip()
+
+def register_ux_widget_tools(mcp: FastMCP):
+    """Register hello world widget tools with FastMCP."""
+    
+    # Register the widget resource
+    @mcp.resource(
+        uri="ui://widget/hello-world.html",
+        name="hello-world-widget",
+        title="Hello World Widget",
+        description="A simple hello world widget demonstrating ChatGPT custom UI",
+        mime_type="text/html+skybridge"
+    )
+    def hello_world_widget_resource():
+        """Return the HTML content for the hello world widget."""
+        return HELLO_WORLD_WIDGET_HTML
 
     # Register the tool that uses the widget
     @mcp.tool(